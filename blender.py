@@ -1,9 +1,6 @@
-import bisect
-import copy
-import functools
-import math
-import random
 import json
+import os
+import subprocess
 import bpy
 
 bpy.context.scene.frame_set(0)
@@ -11,87 +8,85 @@ bpy.context.scene.frame_set(0)
 global ctime
 ctime = 0
 
+# objects animated on every step, looked up once.
+PIECE_OBJS = {chr(k+ord("a")): bpy.data.objects[chr(k+ord("a"))] for k in range(0,14)}
+
 def advanceTime(nt):
+    # keys are inserted at ctime directly, the scene frame is only
+    # set once the replay ends to avoid evaluating every step.
     global ctime
     ctime += nt
-    bpy.context.scene.frame_set(ctime)
 
 def select(objName):
-    ob = bpy.context.scene.objects[objName]       # Get the object
-    bpy.ops.object.select_all(action='DESELECT') # Deselect all objects
-    bpy.context.view_layer.objects.active = ob   # Make the cube the active object
-    ob.select_set(True)
-    return ob
+    return PIECE_OBJS[objName]
 
 def keyLocation(pieceName):
-    select(pieceName)
-    bpy.ops.anim.keyframe_insert_by_name(type="Location")
+    ob = select(pieceName)
+    ob.keyframe_insert(data_path="location", frame=ctime)
 
 def keyAll():
-    for k in range(0,14):
-        keyLocation(chr(k+ord("a")))
+    for ob in PIECE_OBJS.values():
+        ob.keyframe_insert(data_path="location", frame=ctime)
 
 
 def move(piece, direction, amount):
-    bo = select(piece)
+    ob = select(piece)
+    ob.location.x += direction[0]*amount
+    ob.location.y += direction[1]*amount
 
-    bpy.ops.transform.translate(value=(direction[0]*amount, direction[1]*amount, 0),
-                                orient_type='GLOBAL', orient_matrix=((1, 0, 0), (0, 1, 0), (0, 0, 1)),
-                                orient_matrix_type='GLOBAL', constraint_axis=(False, True, False),
-                                mirror=True,
-                                use_proportional_edit=False,
-                                proportional_edit_falloff='SMOOTH',
-                                proportional_size=1,
-                                use_proportional_connected=False,
-                                use_proportional_projected=False,
-                                release_confirm=True)
 
+def animate(piece, direction, amount, nnt):
+    # only the moving piece is keyed, holding it until the move starts
+    # and at its end; the other pieces keep still between their keys.
+    keyLocation(piece)
+    advanceTime(nnt)
+    move(piece, direction, amount)
+    keyLocation(piece)
 
 def left(piece, amount, nnt):
-    advanceTime(nnt)
-    move(piece, [1,0], -2 * amount)
-    keyAll()
+    animate(piece, [1,0], -2 * amount, nnt)
 
 def right(piece, amount, nnt):
-    advanceTime(nnt)
-    move(piece, [1,0], 2 * amount)
-    keyAll()
+    animate(piece, [1,0], 2 * amount, nnt)
 
 def down(piece, amount, nnt):
-    advanceTime(nnt)
-    move(piece, [0,1], -2 * amount)
-    keyAll()
+    animate(piece, [0,1], -2 * amount, nnt)
 
 def up(piece, amount, nnt):
-    advanceTime(nnt)
-    move(piece, [0,1], 2 * amount)
-    keyAll()
+    animate(piece, [0,1], 2 * amount, nnt)
+
+# direction names used in the moves file.
+DISPATCH = {'up': up, 'down': down, 'left': left, 'right': right}
 
 
+def process_moves(moves):
+    # nothing here needs undo, stop recording it during the replay.
+    edit = bpy.context.preferences.edit
+    use_global_undo = edit.use_global_undo
+    edit.use_global_undo = False
+    try:
+        for move in moves:
+            if len(move) == 4:
+                number, piece, direction, amount = move
+                print(f"Move {number}: Piece '{piece}', Direction '{direction}', Amount {amount}")
+                amount = int(amount)
+                advance_frames = 5
+                if piece == "advance_frames":
+                    advance_frames += 4
+                animation = DISPATCH.get(direction)
+                if animation:
+                    animation(piece, amount, advance_frames + amount)
+            else:
+                print("Invalid move format")
+    finally:
+        edit.use_global_undo = use_global_undo
+        bpy.context.scene.frame_set(ctime)
+
 def read_and_process_moves(json_file):
     try:
         with open(json_file, 'r') as file:
             data = json.load(file)
-            moves = data.get('moves', [])
-
-            for move in moves:
-                if len(move) == 4:
-                    number, piece, direction, amount = move
-                    print(f"Move {number}: Piece '{piece}', Direction '{direction}', Amount {amount}")
-                    amount = int(amount)
-                    advance_frames = 5
-                    if piece == "advance_frames":
-                        advance_frames += 4
-                    if direction == "up":
-                        up(piece, amount, advance_frames + amount)
-                    if direction == "down":
-                        down(piece, amount, advance_frames + amount)
-                    if direction == "left":
-                        left(piece, amount, advance_frames + amount)
-                    if direction == "right":
-                        right(piece, amount, advance_frames + amount)
-                else:
-                    print("Invalid move format")
+            process_moves(data.get('moves', []))
     except FileNotFoundError:
         print("File not found")
     except json.JSONDecodeError:
@@ -99,11 +94,41 @@ def read_and_process_moves(json_file):
     except Exception as e:
         print(f"An error occurred: {e}")
 
+def solve_and_process_moves(solver):
+    # the search runs on its own interpreter, out of Blender,
+    # and only the moves it prints are animated here.
+    if not os.path.isfile(solver):
+        print(f"Solver {solver!r} not found")
+        return
+    try:
+        result = subprocess.run([solver_python, solver, "--json"],
+                                capture_output=True, text=True, check=True)
+        data = json.loads(result.stdout)
+        process_moves(data.get('moves', []))
+    except FileNotFoundError:
+        # the solver is there, so it is the interpreter that is missing.
+        print(f"Interpreter {solver_python!r} not found to run solver {solver!r}")
+    except subprocess.CalledProcessError as e:
+        print(f"Solver failed: {e.stderr}")
+    except json.JSONDecodeError:
+        print("Error decoding JSON")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
 # Replace 'your_file.json' with the path to your JSON file
 json_file = '/Users/mariano/code/GitHub/ppz/impossible_as_list.json'
-
-for k in range(0,14):
-    keyLocation(chr(k+ord("a")))
+# or set solver to the path of solution.py to solve the board first,
+# PyPy runs the search much faster than the Python inside Blender.
+solver = None
+# the interpreter running the solver, it can be set to 'python3'
+# when PyPy is not installed.
+solver_python = 'pypy3'
+
+# every piece starts keyed at frame 0.
+keyAll()
 advanceTime(10)
     
-read_and_process_moves(json_file)
\ No newline at end of file
+if solver:
+    solve_and_process_moves(solver)
+else:
+    read_and_process_moves(json_file)
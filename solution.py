@@ -1,19 +1,32 @@
-import bisect
-import copy
-import functools
+import collections
+import heapq
+import json
 import math
 import random
+import sys
 import time
 
 # global variable to define the amount of random
 # movements when the option is chosen.
 g_random_moves = 1000
+# print the board every 11 random movements, otherwise
+# only the final board is printed.
+g_verbose = False
 PENALTY_DIVISION = .1
+# cell values of the board.
+EMPTY = ord('0')
+WALL = ord('O')
 
 class Board:
     """
     A class representing a Board filled with blocks.
-    - 'board' contains the data of the board.
+    - 'pieces' contains the name of each piece, and 'index' the
+      position of each name in it.
+    - 'masks' contain the cells of each piece by their index, as the
+      bits of an int, bit y * W + x for the cell (x, y).
+    - 'walls' contains the cells of the walls the same way, and
+      'occupied' those of every cell that is not empty.
+    - 'board' renders the cells of the board, a byte each.
     """
     
     board_9 = [['O', 'O', 'O', 'O', 'O', 'O'],
@@ -33,83 +46,170 @@ class Board:
                 ['O', 'i', 'i', 'h', 'k', 'k', 'O'],
                 ['O', 'l', '0', '0', '0', 'm', 'O'],
                 ['O', 'O', 'O', 'O', 'O', 'O', 'O']]
-    
-    def __init__(self):
-        self.board = Board.board_10
-        self.objetive_position = [2, len(self.board) - 2]
-        self.resetCache()
-        self.pieces = {}
-        self.hashes = {}
-        self.computePieces()
-        
-        Board.oppositeDirection = {'u':'d','d':'u','l':'r','r':'l'}
 
-    def resetCache(self):
-        self._defective = 10000000
+    # random keys of each piece shape, pieces of the same shape
+    # hash alike, see hash.
+    zobrist = {}
+    zobristRandom = random.Random(9757157)
 
-    def computePieces(self):
-        """
-        computes the pieces and where they can be found.
-        """
-        # initialising the pieces dictionary with
-        # empty arrays
-        for line in self.board:
-            for p in line:
-                if p.islower() and p not in self.pieces:
-                    self.pieces[p] = []
+    # pieces that should not end up below b.
+    incompatibles = ['a','c','i','g','k','e','f','j']
 
-        # adding coordinates to those pieces.
-        for y, line in enumerate(self.board):
-            for x, element in enumerate(line):
-                if element in self.pieces:
-                    self.pieces[element].append([x, y])
+    # possible moves of boards already visited, by their cells.
+    movesCache = {}
+    movesCacheSize = 1 << 16
 
-        for k in self.pieces.keys():
-            self.hashes[k] = self.pieceHash(k)
+    # unit step of each direction.
+    directions = {'l': (-1, 0), 'r': (1, 0), 'u': (0, -1), 'd': (0, 1)}
+    
+    # a board is created for every node of the search, keeping
+    # its attributes in slots saves a dict for each of them.
+    __slots__ = ('W', 'H', 'steps', 'shifts', 'objetive_position', 'objetive',
+                 'bDefectives', 'cellOrder', 'defectives', 'incompatible',
+                 'pieces', 'index', 'masks', 'corners', 'walls', 'occupied',
+                 'keys', '_hash', 'below')
 
-    def pieceHash(self, piece):
-        if piece in self.pieces.keys():
-            pieceCoordinates = self.pieces[piece][0]
-            return hash((pieceCoordinates[0]*9757157, pieceCoordinates[1]))
-        return 1234567
+    def __init__(self):
+        layout = Board.board_10
+        self.W = len(layout[0])
+        self.H = len(layout)
+        self.objetive_position = [2, self.H - 2]
+        # the cell of the first corner of b when solved.
+        self.objetive = self.objetive_position[1] * self.W + self.objetive_position[0]
+        # one byte per cell, row after row, (x, y) is at y * W + x.
+        self.computePieces(bytearray(''.join(''.join(line) for line in layout), 'ascii'))
+        # index offset of a step in each direction, with the
+        # names of the moves of 0, 1, 2 ... steps that way.
+        self.steps = [(dy * self.W + dx, [d + str(n) for n in range(max(self.W, self.H))])
+                      for d, (dx, dy) in Board.directions.items()]
+        # the index offset of each move, as -2 for 'l2',
+        # so moves are never parsed.
+        self.shifts = {d + str(n): (dy * self.W + dx) * n
+                       for d, (dx, dy) in Board.directions.items()
+                       for n in range(max(self.W, self.H))}
+        # b_defective of b having its first corner on each cell, and
+        # the order of each cell comparing (x, y) coordinates.
+        self.bDefectives = [self.bDistance(i % self.W, i // self.W)
+                            for i in range(self.W * self.H)]
+        self.cellOrder = [x * self.H + y
+                          for y in range(self.H) for x in range(self.W)]
+        # defective by the cell of the first corner of b and how many
+        # incompatibles are not above it, adding them one by one.
+        self.defectives = []
+        for defective in self.bDefectives:
+            row = [defective]
+            for _ in Board.incompatibles:
+                defective += 2 / len(Board.incompatibles)
+                row.append(defective)
+            self.defectives.append(row)
+        self.incompatible = [p in Board.incompatibles for p in self.pieces]
+        self.below = self.countBelow()
+
+    def clone(self):
+        """
+        Returns a copy of this board, only the containers
+        modified by move are duplicated.
+        """
+        board = Board.__new__(Board)
+        board.W = self.W
+        board.H = self.H
+        board.steps = self.steps
+        board.shifts = self.shifts
+        board.objetive_position = self.objetive_position
+        board.objetive = self.objetive
+        board.bDefectives = self.bDefectives
+        board.cellOrder = self.cellOrder
+        board.defectives = self.defectives
+        board.incompatible = self.incompatible
+        board.pieces = self.pieces
+        board.index = self.index
+        board.masks = self.masks[:]
+        board.corners = self.corners[:]
+        board.walls = self.walls
+        board.occupied = self.occupied
+        board.keys = self.keys
+        board._hash = self._hash
+        board.below = self.below
+        return board
+
+    def computePieces(self, cells):
+        """
+        computes the pieces and where they can be found
+        from the cells of the board.
+        """
+        # numbering the pieces in the order they are found
+        # and initialising their masks empty
+        self.pieces = []
+        self.index = {}
+        for element in cells:
+            p = chr(element)
+            if p.islower() and p not in self.index:
+                self.index[p] = len(self.pieces)
+                self.pieces.append(p)
+        self.masks = [0 for _ in self.pieces]
+
+        # adding cells to those pieces.
+        self.walls = 0
+        self.occupied = 0
+        for i, element in enumerate(cells):
+            p = self.index.get(chr(element))
+            if p is not None:
+                self.masks[p] |= 1 << i
+            elif element == WALL:
+                self.walls |= 1 << i
+            if element != EMPTY:
+                self.occupied |= 1 << i
+        # the cell of the first coordinate of each piece, its lowest bit.
+        self.corners = [(mask & -mask).bit_length() - 1 for mask in self.masks]
+
+        # the hash of the board is the xor of the hash of each piece.
+        self.keys = [self.zobristKeys(i) for i in range(len(self.pieces))]
+        self._hash = 0
+        for i in range(len(self.pieces)):
+            self._hash ^= self.pieceHash(i)
+
+    def zobristKeys(self, i):
+        """
+        Returns the random keys hashing the first coordinate of the piece
+        with index i, one per cell. Pieces of the same shape share them.
+        """
+        # the mask of the piece with its first corner moved to cell 0.
+        shape = self.masks[i] >> self.corners[i]
+        if shape not in Board.zobrist:
+            Board.zobrist[shape] = [Board.zobristRandom.getrandbits(64)
+                                    for _ in range(self.W * self.H)]
+        return Board.zobrist[shape]
+
+    def corner(self, i):
+        """
+        Returns the cell of the first coordinate of the piece with
+        index i, kept up to date by move.
+        """
+        return self.corners[i]
+
+    def pieceHash(self, i):
+        """
+        Returns the key of the first coordinate of the piece
+        with index i.
+        """
+        return self.keys[i][self.corner(i)]
 
     @property
     def hash(self):
         """
-        Returns the hash from the tuple of first coordinates of each piece,
-        given they cannot rotate, that defines their unique value.
-        The hash for each piece coordinate is computed multiplying the first
-        coordinate by length of the board adding the second coordinate,
-        to ensure there won't be a clash.
+        Returns the hash of the board, kept up to date by move, xoring out
+        the key of the old first coordinate of the moved piece and xoring
+        in the new one. Pieces of the same shape hash alike, so boards that
+        only differ on swapping two of them get the same hash.
         """
-        # unique ones
-        l = self.pieceHash('l')
-        m = self.pieceHash('m')
-        n = self.pieceHash('n')
-    
-        i = self.pieceHash('i')
-        k = self.pieceHash('k')
-        g = self.pieceHash('g')
-        e = self.pieceHash('e')
-        f = self.pieceHash('f')
-        j = self.pieceHash('j')
-    
-        h = self.pieceHash('h')
-        d = self.pieceHash('d')
-    
-        # two vertical
-        a = self.pieceHash('a')
-        c = self.pieceHash('c')
+        return self._hash
 
-        b = self.pieceHash('b')
-        return hash((l*m*n, i*k*g*e*f*j, h*d, a*c,b))
-
-    @property
-    def b_defective(self):
+    def bDistance(self, x, y):
         """
         returns how far is b from final position
+        having its first corner on (x, y).
         """
-        b_first_corner = self.pieces['b'][0]
+        b_first_corner = (x, y)
         b_distance_to_objective = [0,0]
         b_distance_to_objective[0] = self.objetive_position[0] - b_first_corner[0]
         b_distance_to_objective[1] = self.objetive_position[1] - b_first_corner[1]
@@ -118,7 +218,27 @@ class Board:
         
         result = math.sqrt(b_distance_to_objective[0]**2 + b_distance_to_objective[1]**2) * 2
         return result
+
+    @property
+    def b_defective(self):
+        """
+        returns how far is b from final position
+        """
+        return self.bDefectives[self.corners[self.index['b']]]
     
+    def countBelow(self):
+        """
+        returns how many incompatibles are not above b,
+        comparing their first corners as (x, y) tuples.
+        """
+        b_first_corner = self.cellOrder[self.corners[self.index['b']]]
+        below = 0
+        for incompatible in Board.incompatibles:
+            bad_first_corner = self.cellOrder[self.corners[self.index[incompatible]]]
+            if bad_first_corner >= b_first_corner:
+                below += 1
+        return below
+
     @property
     def defective(self):
         """
@@ -126,176 +246,180 @@ class Board:
         how far is this board from the final solution:
             - how far is b from final position
             - how much e up relative to b
+        both kept up to date by move.
         """
-        if self._defective != 10000000:
-            return self._defective
-
-        defective = self.b_defective
-    
-        b_first_corner = self.pieces['b'][0]
-
-        incompatibles = ['a','c','i','g','k','e','f','j']
-        for incompatible in incompatibles:
-            bad_first_corner = self.pieces[incompatible][0]
-            if bad_first_corner >= b_first_corner:
-                defective += 2 / len(incompatibles)
-        
-        self._defective = defective
-        return defective
+        return self.defectives[self.corners[self.index['b']]][self.below]
 
     @property
     def done(self):
         """
-        returns True if this board got to its objective.
+        returns True if this board got to its objective,
+        that is b_defective being 0.
         """
-        return self.b_defective == 0.0
+        return self.corners[self.index['b']] == self.objetive
 
     def printState(self):
         """
         Prints the board on it's current state.
         """
-        for line in self.board:
-            print(line)
+        for y in range(self.H):
+            print(list(self.board[y * self.W:(y + 1) * self.W].decode()))
         print("defectiveness:", self.defective)
 
+    @property
+    def board(self):
+        """
+        Returns the cells of the board, a byte each, row after row,
+        with (x, y) at y * W + x.
+        """
+        cells = bytearray([EMPTY]) * (self.W * self.H)
+        for cell, mask in zip([WALL] + [ord(p) for p in self.pieces],
+                              [self.walls] + self.masks):
+            while mask:
+                low = mask & -mask
+                cells[low.bit_length() - 1] = cell
+                mask ^= low
+        return cells
+
     def e(self, x, y):
         """
         Returns the element at the given coordinates.
         """
         if x < 0 or y < 0:
-            return 'O'
+            return WALL
     
-        if x >= len(self.board[0]) or y >= len(self.board):
-            return 'O'
-        
-        return self.board[y][x]
-
-    def setE(self, x, y, v):
-        """
-        Sets the element at the given coordinates.
-        """
-        self.board[y][x] = v
+        if x >= self.W or y >= self.H:
+            return WALL
+
+        # read from the masks, without rendering the board.
+        bit = 1 << (y * self.W + x)
+        if not self.occupied & bit:
+            return EMPTY
+        if self.walls & bit:
+            return WALL
+        for p, mask in enumerate(self.masks):
+            if mask & bit:
+                return ord(self.pieces[p])
 
     def empty(self, x, y):
         """
         Returns if the element at the given coordinates represents
         an empty space.
         """
-        return self.e(x, y) == '0'
+        if x < 0 or y < 0 or x >= self.W or y >= self.H:
+            return False
+        return not (self.occupied >> (y * self.W + x)) & 1
     
 
-    def piecePossibleMoves(self, piece, coordinates):
+    def piecePossibleMoves(self, piece, out):
         """
-        returns whether or not the is empty spaces in all directions
-        relative to coordinates (coordinates)
-        example within standard board, of input coordinates.
-        [[2, 1], [3, 1], [2, 2], [3, 2]]
-        example of returned value:
-            {'u': True, 'd': False, 'l': False, 'r': False}, True
-        for a piece that can only move up, can be moved (last ret)
+        appends to out a (piece, direction) pair for every move
+        the piece can do, as ('g', 'u1'), ('g', 'u2') for a piece
+        'g' that can only move up, one or two steps.
         """
-        moves = {}
-
-        l = 1
-        clear = True
-        while clear:
-            key = 'l' + str(l)
-            candidates = [self.empty(c[0] - l, c[1]) or (self.e(c[0] - l, c[1]) == piece) for c in coordinates]
-            moves[key] = all(candidates)
-            l+=1
-            clear = moves[key]
-
-        r = 1
-        clear = True
-        while clear:
-            key = 'r' + str(r)
-            moves[key] = all([self.empty(c[0] + r, c[1])
-                or self.e(c[0] + r, c[1]) == piece for c in coordinates])
-            r+=1
-            clear = moves[key]
-
-        u = 1
-        clear = True
-        while clear:
-            key = 'u' + str(u)
-            moves[key] = all([self.empty(c[0], c[1] - u)
-                or self.e(c[0], c[1] - u) == piece for c in coordinates])
-            u+=1
-            clear = moves[key]
-
-        d = 1
-        clear = True
-        while clear:
-            key = 'd' + str(d)
-            moves[key] = all([self.empty(c[0], c[1] + d)
-                or self.e(c[0], c[1] + d) == piece for c in coordinates])
-            d+=1
-            clear = moves[key]
-
-        can_move = any([m[1] for m in moves.items()])
-        return moves, can_move
+        mask = self.masks[self.index[piece]]
+        # the cells the piece can not overlap.
+        blocked = self.occupied ^ mask
+
+        # the border walls keep the shifts inside the board.
+        for offset, names in self.steps:
+            steps = 1
+            if offset > 0:
+                shifted = mask << offset
+                while not shifted & blocked:
+                    out.append((piece, names[steps]))
+                    shifted <<= offset
+                    steps += 1
+            else:
+                offset = -offset
+                shifted = mask >> offset
+                while not shifted & blocked:
+                    out.append((piece, names[steps]))
+                    shifted >>= offset
+                    steps += 1
+
+    def playableMoves(self, out):
+        """
+        appends to out every (piece, direction) move of the board.
+        """
+        for p in self.pieces:
+            self.piecePossibleMoves(p, out)
+        return out
 
     def possibleMoves(self):
         """
         returns only the pieces that can move and their movable direction.
         a possible return value would be like this:
-            {'g': ['d'], 'h': ['d'], 'i': ['r'], 'j': ['l']}
-        for piece 'g' can move down, 'h' can move down, 'i' can move right
-        and 'j' can move left.
+            {'g': ['d1'], 'h': ['d1', 'd2'], 'i': ['r1'], 'j': ['l1']}
+        for piece 'g' can move down, 'h' can move down one or two steps,
+        'i' can move right and 'j' can move left.
         """
         moves = {}
-        for p, c in self.pieces.items():
-            allMoves, canMove = self.piecePossibleMoves(p, c)
-            if canMove:
-                moves[p] = [k for k, v in allMoves.items() if v]
+        for p, direction in self.playableMoves([]):
+            moves.setdefault(p, []).append(direction)
         return moves
 
-    def move(self, pieceName, moves):
+    def cachedPlayableMoves(self):
         """
-        Updates two elements on each call.
-        - the board itself.
-        - each coordinate of the piece
+        playableMoves remembered by the cells of the board, for the random
+        walks (shuffle and brute force) which keep coming back to the same
+        boards. The returned list is shared, it should not be modified.
         """
-        for c in self.pieces[pieceName]:
-            self.setE(c[0], c[1], '0')
-
-        (direction, steps) = moves
-
-        if direction == 'u':
-            for coor in self.pieces[pieceName]:
-                coor[1] -= int(steps)
-
-        if direction == 'd':
-            for coor in self.pieces[pieceName]:
-                coor[1] += int(steps)
-
-        if direction == 'l':
-            for coor in self.pieces[pieceName]:
-                coor[0] -= int(steps)
-
-        if direction == 'r':
-            for coor in self.pieces[pieceName]:
-                coor[0] += int(steps)
-
-        for c in self.pieces[pieceName]:
-            self.setE(c[0], c[1], pieceName)
+        key = tuple(self.masks)
+        moves = Board.movesCache.get(key)
+        if moves is None:
+            if len(Board.movesCache) >= Board.movesCacheSize:
+                Board.movesCache.clear()
+            moves = Board.movesCache[key] = self.playableMoves([])
+        return moves
 
-        self.hashes[pieceName] = self.pieceHash(pieceName)
+    def move(self, pieceName, moves):
+        """
+        Updates three elements on each call.
+        - the mask of the piece, and the occupied cells.
+        - the hash of the board.
+        - the count of incompatibles not above b.
+        """
+        p = self.index[pieceName]
+        # moves is the direction followed by the steps, like 'l2'.
+        shift = self.shifts[moves]
+
+        mask = self.masks[p]
+        moved = mask << shift if shift > 0 else mask >> -shift
+        self.masks[p] = moved
+        self.occupied ^= mask ^ moved
+
+        # the first coordinate shifts as the whole piece.
+        keys = self.keys[p]
+        corner = self.corners[p]
+        self.corners[p] = corner + shift
+        self._hash ^= keys[corner] ^ keys[corner + shift]
+
+        # defective only depends on b and the incompatibles.
+        if pieceName == 'b':
+            self.below = self.countBelow()
+        elif self.incompatible[p]:
+            b_first_corner = self.cellOrder[self.corners[self.index['b']]]
+            self.below += ((self.cellOrder[corner + shift] >= b_first_corner)
+                           - (self.cellOrder[corner] >= b_first_corner))
 
     def simulateMove(self, pieceName, direction):
         """
         emulates the move requested to identify
-        properties of the possible table.
+        properties of the possible table, the hash and
+        done the board would have after it.
+        The board is not modified.
         """
-        # do
-        self.move(pieceName, direction)
-        # store temp data
-        h = self.hash
-        d = self.done
-        # undo
-
-        direction = Board.oppositeDirection[direction[0]] + direction[1]
-        self.move(pieceName, direction)
+        p = self.index[pieceName]
+        shift = self.shifts[direction]
+        corner = self.corners[p]
+        # only the key of the first coordinate of the piece changes.
+        keys = self.keys[p]
+        h = self._hash ^ keys[corner] ^ keys[corner + shift]
+        if pieceName == 'b':
+            d = corner + shift == self.objetive
+        else:
+            d = self.done
         return h, d
 
 class moveNode:
@@ -304,39 +428,33 @@ class moveNode:
     at a given state.
     {'g': ['d'], 'h': ['d'], 'i': ['r'], 'j': ['l']}
     """
-    # a set of hashes for all the seen boards
-    seen = set()
     names = {'d': 'down', 'u': 'up', 'l': 'left', 'r': 'right'}
+    # the line each direction moves along.
+    lines = {'l': 0, 'r': 0, 'u': 1, 'd': 1}
+    __slots__ = ('board', 'parent', 'moves', 'seen', '_deep', 'penalty', 'solution')
 
     def __init__(self, board, parent=None, moves=None):
         self.board = board
         self.parent = parent
         self.moves = moves
-        moveNode.seen.add(board.hash)
-        self.playableMoves = []
-        self.flattenMoves()
+        # a set of hashes for all the seen boards, shared
+        # by every node of the same search.
+        # children are added by nodeMoves when they are queued.
+        if parent is not None:
+            self.seen = parent.seen
+        else:
+            self.seen = {board.hash}
         if parent is not None:
             self._deep = parent.deep + 1
         else:
             self._deep = 0
+        # computed once, the heap compares it on every push and pop.
+        self.penalty = (self.deep/PENALTY_DIVISION) + self.board.defective
 
     @property
     def deep(self):
         return self._deep
 
-    @property
-    def penalty(self):
-        return (self.deep/PENALTY_DIVISION) + self.board.defective
-
-    def flattenMoves(self):
-        """
-        Obtains the possible moves on the board
-        and stripes them on unit possible moves.
-        """
-        for pieceName, directions in self.board.possibleMoves().items():
-            for direction in directions:
-                self.playableMoves.append([None, [pieceName, direction]])
-
     def nodeMoves(self):
         """
         runs through the sequence of possible moves, and
@@ -345,20 +463,30 @@ class moveNode:
         this moment for the current board.
         """
         nodes = []
-        for i, (_, (piece, direction)) in enumerate(self.playableMoves):
+        # moving the last moved piece again along the same line only
+        # gives the parent or boards it reached with one move, all seen.
+        if self.moves is not None:
+            lastPiece, lastMove = self.moves
+            lastLine = moveNode.lines[lastMove[0]]
+        else:
+            lastPiece = None
+        # the moves are only obtained when the node is expanded,
+        # nodes waiting in the queue do not hold them.
+        for piece, direction in self.board.playableMoves([]):
+            if piece == lastPiece and moveNode.lines[direction[0]] == lastLine:
+                continue
             # we simulate the move in place
             hashr, done = self.board.simulateMove(piece, direction)
             # if the result of the similation was
             # previously visited we skip this step
-            if hashr in moveNode.seen:
+            if hashr in self.seen:
                 continue
+            self.seen.add(hashr)
 
             # print("\tnovel move: "+ piece +" "+direction)
             if done:
-                # a bit of a celebration here!.
-                print('\n\n-----------*****************************-----------')
-                print('-----------* This solves the problem! **-----------')
-                print('-----------*****************************-----------\n\n')
+                # the board of this node is left solved and the
+                # moves from the root are kept in self.solution.
                 self.board.move(piece, direction)
                 moveInstructions = [[piece,direction]]
                 parentIt = self
@@ -368,30 +496,72 @@ class moveNode:
                         moveInstructions.insert(0, parentIt.moves)
                     parentIt = parentIt.parent
 
-                for step, m in enumerate(moveInstructions):
-                    name = moveNode.names[m[1][0]]
-                    print (f"Step:{(step + 1)}: piece:{m[0]}: moves:{name}: nSteps:{m[1][1]}:")
-
+                self.solution = moveInstructions
                 return None
 
-            newBoard = copy.deepcopy(self.board)
-            newBoard.resetCache()
+            newBoard = self.board.clone()
             newBoard.move(piece, direction)
             newMove = moveNode(newBoard, self, [piece, direction])
             nodes.append(newMove)
 
         return nodes
 
+def solve(board):
+    """
+    Runs the A* search from the given board.
+    Returns the node that solved it, its 'solution' holds the
+    [piece, direction] moves from the given board, or None
+    if there is no solution.
+    """
+    # nodes are kept in a stack per penalty, so that among equal
+    # penalties the newest node pops first, and the heap only
+    # holds the penalties that have nodes waiting.
+    root = moveNode(board)
+    buckets = {root.penalty: [root]}
+    penalties = [root.penalty]
+    while penalties:
+        bucket = buckets[penalties[0]]
+        queuedNode = bucket.pop()
+        if not bucket:
+            del buckets[heapq.heappop(penalties)]
+        nextMoves = queuedNode.nodeMoves()
+        if nextMoves is None:
+            return queuedNode
+
+        for ns in nextMoves:
+            bucket = buckets.get(ns.penalty)
+            if bucket is None:
+                buckets[ns.penalty] = [ns]
+                heapq.heappush(penalties, ns.penalty)
+            else:
+                bucket.append(ns)
+
+    return None
+
+def dijkstra(board):
+    """
+    Runs a Dijkstra search from the given board. Every move costs
+    the same, so the nodes are expanded in the order they were
+    found, breadth first, and the solution has the fewest moves.
+    Returns the node that solved it as solve does, or None.
+    """
+    queue = collections.deque([moveNode(board)])
+    while queue:
+        queuedNode = queue.popleft()
+        nextMoves = queuedNode.nodeMoves()
+        if nextMoves is None:
+            return queuedNode
+        queue.extend(nextMoves)
+
+    return None
 
-@functools.total_ordering
-class Node:
-    def __init__(self, node):
-        self.node = node
-        self.penalty = node.penalty
-    def __lt__(self, other):
-        return self.penalty < other.penalty
-    def __str__(self):
-        return '{} {}'.format(self.node, self.penalty)
+def movesAsList(moveInstructions):
+    """
+    Returns the moves on the format read by blender.py:
+        [[step, piece, direction name, amount], ...]
+    """
+    return [[step + 1, piece, moveNode.names[direction[0]], int(direction[1:])]
+            for step, (piece, direction) in enumerate(moveInstructions)]
 
 def playBoard():
     """
@@ -440,50 +610,49 @@ def playBoard():
         if inputOption == 'r':
             st = 0
             for _ in range(0, g_random_moves + 1):
-                moves_dict = myboard.possibleMoves()
-                pos_moves_listed = list(moves_dict)
-                option = random.choice(pos_moves_listed)
-                print(option)
-                directions = moves_dict[option]
-                direction = random.choice(directions)
+                # every move of the board is equally likely.
+                option, direction = random.choice(myboard.cachedPlayableMoves())
                 myboard.move(option, direction)
-                myboard.printState()
-                print("Board shuffled", st, "times.")
+                if g_verbose and st % 11 == 0:
+                    myboard.printState()
+                    print("Board shuffled", st, "times.")
                 st += 1
+            myboard.printState()
+            print("Board shuffled", st, "times.")
 
         # Brute force
         if inputOption == 'b':
             st = 0
-            while myboard.defective != 0:
-                moves_dict = myboard.possibleMoves()
-                pos_moves_listed = list(moves_dict)
-                option = random.choice(pos_moves_listed)
-                directions = moves_dict[option]
-                direction = random.choice(directions)
+            # defective can stay above 0 once b is in place,
+            # the walk stops when the board is done.
+            while not myboard.done:
+                option, direction = random.choice(myboard.cachedPlayableMoves())
                 myboard.move(option, direction)
-                if st % 11 == 0:
+                if g_verbose and st % 11 == 0:
                     myboard.printState()
                     print("Board shuffled", st, "times.")
                 st += 1
             myboard.printState()
             print("Board shuffled", st, "times.")
 
-        # educated guess solution
-        if inputOption == 'a':
-            queue = [Node(moveNode(myboard))]
-            while queue:
-                queuedNode = queue.pop(0)
-                nextMoves = queuedNode.node.nodeMoves()
-                if nextMoves is None:
-                    print('\n\n')
-                    queuedNode.node.board.printState()
-                    print("Seen size " + str(len(moveNode.seen)))
-                    return
-
-                for ns in nextMoves:
-                    bisect.insort_left(queue, Node(ns))
-
-            print("No solution found")
+        # educated guess solution, or the shortest one
+        search = {'a': solve, 'd': dijkstra}.get(inputOption)
+        if search:
+            solved = search(myboard)
+            if solved is None:
+                print("No solution found")
+                return
+
+            # a bit of a celebration here!.
+            print('\n\n-----------*****************************-----------')
+            print('-----------* This solves the problem! **-----------')
+            print('-----------*****************************-----------\n\n')
+            for step, piece, name, amount in movesAsList(solved.solution):
+                print (f"Step:{step}: piece:{piece}: moves:{name}: nSteps:{amount}:")
+
+            print('\n\n')
+            solved.board.printState()
+            print("Seen size " + str(len(solved.seen)))
             return
 
         if inputOption == 's':
@@ -491,15 +660,27 @@ def playBoard():
 
 
 
-start_time = time.time()
+if __name__ == '__main__':
+    # with --json the board is solved without the menu and the moves
+    # are printed as the json read by blender.py, so the search can
+    # run on a faster interpreter (PyPy) than the one inside Blender.
+    if '--json' in sys.argv:
+        solved = solve(Board())
+        if solved is None:
+            print("No solution found", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps({'moves': movesAsList(solved.solution)}, indent=2))
+        sys.exit(0)
+
+    start_time = time.time()
 
-playBoard()
+    playBoard()
 
-end_time = time.time()
-elapsed_seconds = end_time - start_time
+    end_time = time.time()
+    elapsed_seconds = end_time - start_time
 
-hours = elapsed_seconds // 3600
-minutes = (elapsed_seconds % 3600) // 60
-seconds = elapsed_seconds % 60
+    hours = elapsed_seconds // 3600
+    minutes = (elapsed_seconds % 3600) // 60
+    seconds = elapsed_seconds % 60
 
-print(f"Execution time: {int(hours)} hours, {int(minutes)} minutes, {seconds:.2f} seconds")
\ No newline at end of file
+    print(f"Execution time: {int(hours)} hours, {int(minutes)} minutes, {seconds:.2f} seconds")
@@ -1,16 +1,25 @@
-import bisect
-import copy
-import functools
+from array import array
+import collections
+import heapq
 import math
 import random
 
 # global variable to define the amount of random
 # movements when the option is chosen.
 g_random_moves = 1000
+# print the board every 11 random movements, otherwise
+# only the final board is printed.
+g_verbose = False
+# cell values of the board.
+EMPTY = ord('0')
+WALL = ord('O')
+
 class Board:
     """
     A class representing a Board filled with blocks.
-    - 'board' contains the data of the board.
+    - 'board' contains the cells of the board, a byte each.
+    - 'px' and 'py' contain the x and y coordinates of each piece,
+    by its index in 'pieces'.
     For deduction we can state that: for the board
     to be solved this constraints need satisfied:
     1 - Piece B needs to occupy [(2,4),(2,5),(3,4),(3,5)]
@@ -37,80 +46,157 @@ class Board:
                 ['O', 'l', '0', '0', '0', 'm', 'O'],
                 ['O', 'O', 'O', 'O', 'O', 'O', 'O']]
 
+    # random keys of each piece shape, pieces of the same shape
+    # hash alike, see hash.
+    zobrist = {}
+    zobristRandom = random.Random(9757157)
+
+    # possible moves of boards already visited, by their cells.
+    movesCache = {}
+    movesCacheSize = 1 << 16
+
+    # unit step of each direction.
+    directions = {'l': (-1, 0), 'r': (1, 0), 'u': (0, -1), 'd': (0, 1)}
+
+    # a board is created for every node of the search, keeping
+    # its attributes in slots saves a dict for each of them.
+    __slots__ = ('W', 'H', 'board', 'objetive_position', 'steps', 'frontiers',
+                 'offsets', 'bDefectives', 'pieces', 'index', 'px', 'py',
+                 'keys', '_hash', '_defective')
+
     def __init__(self):
-        self.board = Board.board_9
-        self.objetive_position = [2, len(self.board) - 2]
+        layout = Board.board_9
+        self.W = len(layout[0])
+        self.H = len(layout)
+        # one byte per cell, row after row, (x, y) is at y * W + x.
+        self.board = bytearray(''.join(''.join(line) for line in layout), 'ascii')
+        self.objetive_position = [2, self.H - 2]
+        # index offset of a step in each direction, with the
+        # names of the moves of 0, 1, 2 ... steps that way.
+        self.steps = [(dy * self.W + dx, [d + str(n) for n in range(max(self.W, self.H))])
+                      for d, (dx, dy) in Board.directions.items()]
+        # the (dx, dy) of each move, as (-2, 0) for 'l2',
+        # so moves are never parsed.
+        self.offsets = {d + str(n): (dx * n, dy * n)
+                        for d, (dx, dy) in Board.directions.items()
+                        for n in range(max(self.W, self.H))}
+        # b_defective of b having its first corner on each cell.
+        self.bDefectives = [self.bDistance(i % self.W, i // self.W)
+                            for i in range(self.W * self.H)]
         self.resetCache()
-        self.pieces = {}
-        self.hashes = {}
         self.computePieces()
-        
-        Board.oppositeDirection = { 'u':'d','d':'u','l':'r','r':'l'}
 
     def resetCache(self):
         self._defective = 10000000
 
+    def clone(self):
+        """
+        Returns a copy of this board, only the containers
+        modified by move are duplicated.
+        """
+        board = Board.__new__(Board)
+        board.W = self.W
+        board.H = self.H
+        board.board = self.board[:]
+        board.objetive_position = self.objetive_position
+        board.steps = self.steps
+        board.frontiers = self.frontiers
+        board.offsets = self.offsets
+        board.bDefectives = self.bDefectives
+        board.pieces = self.pieces
+        board.index = self.index
+        board.px = [v[:] for v in self.px]
+        board.py = [v[:] for v in self.py]
+        board.keys = self.keys
+        board._hash = self._hash
+        board._defective = self._defective
+        return board
+
     def computePieces(self):
         """
         computes the pieces and where they can be found.
         """
-        # initialising the pieces dictionary with
-        # empty arrays
-        for line in self.board:
-            for p in line:
-                if p.islower() and p not in self.pieces:
-                    self.pieces[p] = []
+        # numbering the pieces in the order they are found
+        # and initialising their coordinate arrays empty
+        self.pieces = []
+        self.index = {}
+        for element in self.board:
+            p = chr(element)
+            if p.islower() and p not in self.index:
+                self.index[p] = len(self.pieces)
+                self.pieces.append(p)
+        self.px = [array('b') for _ in self.pieces]
+        self.py = [array('b') for _ in self.pieces]
 
         # adding coordinates to those pieces.
-        for y, line in enumerate(self.board):
-            for x, element in enumerate(line):
-                if element in self.pieces:
-                    self.pieces[element].append([x, y])
-
-        for k in self.pieces.keys():
-            self.hashes[k] = self.pieceHash(k)
-
-    def pieceHash(self, piece):
-        if piece in self.pieces.keys():
-            pieceCoordinates = self.pieces[piece][0]
-            return hash((pieceCoordinates[0]*9757157, pieceCoordinates[1]))
-        return 1234567
+        for i, element in enumerate(self.board):
+            p = self.index.get(chr(element))
+            if p is not None:
+                y, x = divmod(i, self.W)
+                self.px[p].append(x)
+                self.py[p].append(y)
+
+        # for each piece, the steps of every direction with the cells,
+        # relative to its first one, that have no cell of the piece
+        # next to them that way. only those can be blocked by a move.
+        self.frontiers = []
+        for p in range(len(self.pieces)):
+            cells = [y * self.W + x for x, y in zip(self.px[p], self.py[p])]
+            self.frontiers.append([(offset, names, [i - cells[0] for i in cells
+                                                    if i + offset not in cells])
+                                   for offset, names in self.steps])
+
+        # the hash of the board is the xor of the hash of each piece.
+        self.keys = [self.zobristKeys(i) for i in range(len(self.pieces))]
+        self._hash = 0
+        for i in range(len(self.pieces)):
+            self._hash ^= self.pieceHash(i)
+
+    def zobristKeys(self, i):
+        """
+        Returns the random keys hashing the first coordinate of the piece
+        with index i, one per cell. Pieces of the same shape share them.
+        """
+        # the coordinates of the piece relative to its first one.
+        xs = self.px[i]
+        ys = self.py[i]
+        shape = tuple((x - xs[0], y - ys[0]) for x, y in zip(xs, ys))
+        if shape not in Board.zobrist:
+            Board.zobrist[shape] = [Board.zobristRandom.getrandbits(64)
+                                    for _ in range(self.W * self.H)]
+        return Board.zobrist[shape]
+
+    def pieceHash(self, i):
+        """
+        Returns the key of the first coordinate of the piece
+        with index i.
+        """
+        return self.keys[i][self.py[i][0] * self.W + self.px[i][0]]
 
     @property
     def hash(self):
         """
-        Returns the hash from the tuple of first coordinates of each piece,
-        given they cannot rotate, that defines their unique value.
-        The hash for each piece coordinate is computed multiplying the first
-        coordinate by length of the board adding the second coordinate,
-        to ensure there won't be a clash.
+        Returns the hash of the board, kept up to date by move, xoring out
+        the key of the old first coordinate of the moved piece and xoring
+        in the new one. Pieces of the same shape hash alike, so boards that
+        only differ on swapping two of them get the same hash.
         """
-        # unique ones
-        g = self.pieceHash('g')
-        h = self.pieceHash('h')
-        i = self.pieceHash('i')
-        j = self.pieceHash('j')
-
-        # two vertical
-        a = self.pieceHash('a')
-        c = self.pieceHash('c')
-        d = self.pieceHash('d')
-        f = self.pieceHash('f')
+        return self._hash
 
-        # two horizontal
-        e = self.pieceHash('e')
-
-        # two by two
-        b = self.pieceHash('b')
-        return hash((g * h * i * j, a * c * d * f, e, b))
+    def bDistance(self, x, y):
+        """
+        returns how far is b from final position
+        having its first corner on (x, y).
+        """
+        return math.sqrt((self.objetive_position[0] - x)**2 + (self.objetive_position[1] - y)**2)
 
     @property
     def b_defective(self):
         """
         returns how far is b from final position
         """
-        b_first_corner = self.pieces['b'][0]
-        return math.sqrt((self.objetive_position[0] - b_first_corner[0])**2 + (self.objetive_position[1] - b_first_corner[1])**2)
+        b = self.index['b']
+        return self.bDefectives[self.py[b][0] * self.W + self.px[b][0]]
 
     @property
     def defective(self):
@@ -125,10 +211,10 @@ class Board:
 
         defective = self.b_defective
     
-        b_first_corner = self.pieces['b'][0]
-        if 'e' in self.pieces:
-            e_first_corner = self.pieces['e'][0]
-            defective += max(abs(b_first_corner[1] - e_first_corner[1]), 0) / 2.0
+        e = self.index.get('e')
+        if e is not None:
+            b = self.index['b']
+            defective += max(abs(self.py[b][0] - self.py[e][0]), 0) / 2.0
 
         self._defective = defective
         return defective
@@ -136,16 +222,19 @@ class Board:
     @property
     def done(self):
         """
-        returns True if this board got to its objective.
+        returns True if this board got to its objective,
+        that is b_defective being 0.
         """
-        return self.b_defective == 0.0
+        b = self.index['b']
+        return (self.px[b][0] == self.objetive_position[0]
+                and self.py[b][0] == self.objetive_position[1])
 
     def printState(self):
         """
         Prints the board on it's current state.
         """
-        for line in self.board:
-            print(line)
+        for y in range(self.H):
+            print(list(self.board[y * self.W:(y + 1) * self.W].decode()))
         print("defectiveness:", self.defective)
 
     def e(self, x, y):
@@ -153,77 +242,49 @@ class Board:
         Returns the element at the given coordinates.
         """
         if x < 0 or y < 0:
-            return 'O'
+            return WALL
     
-        if x >= len(self.board[0]) or y >= len(self.board):
-            return 'O'
+        if x >= self.W or y >= self.H:
+            return WALL
         
-        return self.board[y][x]
+        return self.board[y * self.W + x]
 
     def setE(self, x, y, v):
         """
         Sets the element at the given coordinates.
         """
-        self.board[y][x] = v
+        self.board[y * self.W + x] = v
 
     def empty(self, x, y):
         """
         Returns if the element at the given coordinates represents
         an empty space.
         """
-        return self.e(x, y) == '0'
+        return self.e(x, y) == EMPTY
     
 
-    def piecePossibleMoves(self, piece, coordinates):
+    def piecePossibleMoves(self, piece, out):
         """
-        returns whether or not the is empty spaces in all directions
-        relative to coordinates (coordinates)
-        example within standard board, of input coordinates.
-        [[2, 1], [3, 1], [2, 2], [3, 2]]
-        example of returned value:
-            {'u': True, 'd': False, 'l': False, 'r': False}, True
-        for a piece that can only move up, can be moved (last ret)
+        appends to out a (piece, direction) pair for every move
+        the piece can do, as ('g', 'u1'), ('g', 'u2') for a piece
+        'g' that can only move up, one or two steps.
         """
-        moves = {}
-
-        l = 1
-        clear = True
-        while clear:
-            key = 'l' + str(l)
-            candidates = [self.empty(c[0] - l, c[1]) or (self.e(c[0] - l, c[1]) == piece) for c in coordinates]
-            moves[key] = all(candidates)
-            l+=1
-            clear = moves[key]
-
-        r = 1
-        clear = True
-        while clear:
-            key = 'r' + str(r)
-            moves[key] = all([self.empty(c[0] + r, c[1])
-                or self.e(c[0] + r, c[1]) == piece for c in coordinates])
-            r+=1
-            clear = moves[key]
-
-        u = 1
-        clear = True
-        while clear:
-            key = 'u' + str(u)
-            moves[key] = all([self.empty(c[0], c[1] - u)
-                or self.e(c[0], c[1] - u) == piece for c in coordinates])
-            u+=1
-            clear = moves[key]
-
-        d = 1
-        clear = True
-        while clear:
-            key = 'd' + str(d)
-            moves[key] = all([self.empty(c[0], c[1] + d)
-                or self.e(c[0], c[1] + d) == piece for c in coordinates])
-            d+=1
-            clear = moves[key]
-
-        can_move = any([m[1] for m in moves.items()])
-        return moves, can_move
+        board = self.board
+        p = self.index[piece]
+        first = self.py[p][0] * self.W + self.px[p][0]
+        cell = ord(piece)
+
+        for offset, names, frontier in self.frontiers[p]:
+            shift = first + offset
+            steps = 1
+            # the cells the frontier moves into have to be empty or of
+            # the piece, the rest of the piece moves into cells already
+            # checked. the border walls keep the shift inside the board.
+            while all(board[i + shift] == EMPTY or board[i + shift] == cell
+                      for i in frontier):
+                out.append((piece, names[steps]))
+                shift += offset
+                steps += 1
 
     def possibleMoves(self):
         """
@@ -234,58 +295,81 @@ class Board:
         and 'j' can move left.
         """
         moves = {}
-        for p, c in self.pieces.items():
-            allMoves, canMove = self.piecePossibleMoves(p, c)
-            if canMove:
-                moves[p] = [k for k, v in allMoves.items() if v]
+        for p, direction in self.playableMoves([]):
+            moves.setdefault(p, []).append(direction)
         return moves
 
+    def cachedPlayableMoves(self):
+        """
+        playableMoves remembered by the cells of the board, for the random
+        walks (shuffle and brute force) which keep coming back to the same
+        boards. The returned list is shared, it should not be modified.
+        """
+        key = bytes(self.board)
+        moves = Board.movesCache.get(key)
+        if moves is None:
+            if len(Board.movesCache) >= Board.movesCacheSize:
+                Board.movesCache.clear()
+            moves = Board.movesCache[key] = self.playableMoves([])
+        return moves
+
+    def playableMoves(self, out):
+        """
+        appends to out every (piece, direction) move of the board.
+        """
+        for p in self.pieces:
+            self.piecePossibleMoves(p, out)
+        return out
+
     def move(self, pieceName, moves):
         """
         Updates two elements on each call.
         - the board itself.
         - each coordinate of the piece
         """
-        for c in self.pieces[pieceName]:
-            self.setE(c[0], c[1], '0')
-
-        (direction, steps) = moves
+        p = self.index[pieceName]
+        xs = self.px[p]
+        ys = self.py[p]
+        self._hash ^= self.pieceHash(p)
 
-        if direction == 'u':
-            for coor in self.pieces[pieceName]:
-                coor[1] -= int(steps)
+        # moves is the direction followed by the steps, like 'l2'.
+        dx, dy = self.offsets[moves]
 
-        if direction == 'd':
-            for coor in self.pieces[pieceName]:
-                coor[1] += int(steps)
+        board = self.board
+        W = self.W
+        for i in range(len(xs)):
+            board[ys[i] * W + xs[i]] = EMPTY
+            xs[i] += dx
+            ys[i] += dy
 
-        if direction == 'l':
-            for coor in self.pieces[pieceName]:
-                coor[0] -= int(steps)
+        cell = ord(pieceName)
+        for i in range(len(xs)):
+            board[ys[i] * W + xs[i]] = cell
 
-        if direction == 'r':
-            for coor in self.pieces[pieceName]:
-                coor[0] += int(steps)
+        self._hash ^= self.pieceHash(p)
 
-        for c in self.pieces[pieceName]:
-            self.setE(c[0], c[1], pieceName)
-
-        self.hashes[pieceName] = self.pieceHash(pieceName)
+        # defective only depends on b and e.
+        if pieceName == 'b' or pieceName == 'e':
+            self.resetCache()
 
     def simulateMove(self, pieceName, direction):
         """
         emulates the move requested to identify
-        properties of the possible table.
+        properties of the possible table, the hash and
+        done the board would have after it.
+        The board is not modified.
         """
-        # do
-        self.move(pieceName, direction)
-        # store temp data
-        h = self.hash
-        d = self.done
-        # undo
-
-        direction = Board.oppositeDirection[direction[0]] + direction[1]
-        self.move(pieceName, direction)
+        p = self.index[pieceName]
+        dx, dy = self.offsets[direction]
+        x = self.px[p][0]
+        y = self.py[p][0]
+        # only the key of the first coordinate of the piece changes.
+        keys = self.keys[p]
+        h = self._hash ^ keys[y * self.W + x] ^ keys[(y + dy) * self.W + x + dx]
+        if pieceName == 'b':
+            d = [x + dx, y + dy] == self.objetive_position
+        else:
+            d = self.done
         return h, d
 
 class moveNode:
@@ -294,40 +378,34 @@ class moveNode:
     at a given state.
     {'g': ['d'], 'h': ['d'], 'i': ['r'], 'j': ['l']}
     """
-    # a set of hashes for all the seen boards
-    seen = set()
     names = {'d': 'down', 'u': 'up', 'l': 'left', 'r': 'right',
             'dt': 'down twice', 'ut': 'up twice', 'lt': 'left twice', 'rt': 'right twice'}
+    # the line each direction moves along.
+    lines = {'l': 0, 'r': 0, 'u': 1, 'd': 1}
+    __slots__ = ('board', 'parent', 'moves', 'seen', '_deep', 'penalty', 'solution')
 
     def __init__(self, board, parent=None, moves=None):
         self.board = board
         self.parent = parent
         self.moves = moves
-        moveNode.seen.add(board.hash)
-        self.playableMoves = []
-        self.flattenMoves()
+        # a set of hashes for all the seen boards, shared
+        # by every node of the same search.
+        # children are added by nodeMoves when they are queued.
+        if parent is not None:
+            self.seen = parent.seen
+        else:
+            self.seen = {board.hash}
         if parent is not None:
             self._deep = parent.deep + 1
         else:
             self._deep = 0
+        # computed once, the heap compares it on every push and pop.
+        self.penalty = (self.deep/13.1) + self.board.defective
 
     @property
     def deep(self):
         return self._deep
 
-    @property
-    def penalty(self):
-        return (self.deep/13.1) + self.board.defective
-
-    def flattenMoves(self):
-        """
-        Obtains the possible moves on the board
-        and stripes them on unit possible moves.
-        """
-        for pieceName, directions in self.board.possibleMoves().items():
-            for direction in directions:
-                self.playableMoves.append([None, [pieceName, direction]])
-
     def nodeMoves(self):
         """
         runs through the sequence of possible moves, and
@@ -336,20 +414,30 @@ class moveNode:
         this moment for the current board.
         """
         nodes = []
-        for i, (_, (piece, direction)) in enumerate(self.playableMoves):
+        # moving the last moved piece again along the same line only
+        # gives the parent or boards it reached with one move, all seen.
+        if self.moves is not None:
+            lastPiece, lastMove = self.moves
+            lastLine = moveNode.lines[lastMove[0]]
+        else:
+            lastPiece = None
+        # the moves are only obtained when the node is expanded,
+        # nodes waiting in the queue do not hold them.
+        for piece, direction in self.board.playableMoves([]):
+            if piece == lastPiece and moveNode.lines[direction[0]] == lastLine:
+                continue
             # we simulate the move in place
             hashr, done = self.board.simulateMove(piece, direction)
             # if the result of the similation was
             # previously visited we skip this step
-            if hashr in moveNode.seen:
+            if hashr in self.seen:
                 continue
+            self.seen.add(hashr)
 
             # print("\tnovel move: "+ piece +" "+direction)
             if done:
-                # a bit of a celebration here!.
-                print('\n\n-----------*****************************-----------')
-                print('-----------* This solves the problem! **-----------')
-                print('-----------*****************************-----------\n\n')
+                # the board of this node is left solved and the
+                # moves from the root are kept in self.solution.
                 self.board.move(piece, direction)
                 moveInstructions = [[piece,direction]]
                 parentIt = self
@@ -359,30 +447,65 @@ class moveNode:
                         moveInstructions.insert(0, parentIt.moves)
                     parentIt = parentIt.parent
 
-                for step, m in enumerate(moveInstructions):
-                    name = moveNode.names[m[1][0]]
-                    print (f"Step {(step + 1)}, piece:, {m[0]}, moves {name}, {m[1][1]} steps")
-
+                self.solution = moveInstructions
                 return None
 
-            newBoard = copy.deepcopy(self.board)
-            newBoard.resetCache()
+            newBoard = self.board.clone()
             newBoard.move(piece, direction)
             newMove = moveNode(newBoard, self, [piece, direction])
             nodes.append(newMove)
 
         return nodes
 
+def solve(board):
+    """
+    Runs the A* search from the given board.
+    Returns the node that solved it, its 'solution' holds the
+    [piece, direction] moves from the given board, or None
+    if there is no solution.
+    """
+    # nodes are kept in a stack per penalty, so that among equal
+    # penalties the newest node pops first, and the heap only
+    # holds the penalties that have nodes waiting.
+    root = moveNode(board)
+    buckets = {root.penalty: [root]}
+    penalties = [root.penalty]
+    while penalties:
+        bucket = buckets[penalties[0]]
+        queuedNode = bucket.pop()
+        if not bucket:
+            del buckets[heapq.heappop(penalties)]
+        nextMoves = queuedNode.nodeMoves()
+        if nextMoves is None:
+            return queuedNode
+
+        for ns in nextMoves:
+            bucket = buckets.get(ns.penalty)
+            if bucket is None:
+                buckets[ns.penalty] = [ns]
+                heapq.heappush(penalties, ns.penalty)
+            else:
+                bucket.append(ns)
+
+    return None
+
+def dijkstra(board):
+    """
+    Runs a Dijkstra search from the given board. Every move costs
+    the same, so the nodes are expanded in the order they were
+    found, breadth first, and the solution has the fewest moves.
+    Returns the node that solved it as solve does, or None.
+    """
+    queue = collections.deque([moveNode(board)])
+    while queue:
+        queuedNode = queue.popleft()
+        nextMoves = queuedNode.nodeMoves()
+        if nextMoves is None:
+            return queuedNode
+        queue.extend(nextMoves)
+
+    return None
 
-@functools.total_ordering
-class Node:
-    def __init__(self, node):
-        self.node = node
-        self.penalty = node.penalty
-    def __lt__(self, other):
-        return self.penalty < other.penalty
-    def __str__(self):
-        return '{} {}'.format(self.node, self.penalty)
 
 def playBoard():
     """
@@ -431,53 +554,54 @@ def playBoard():
         if inputOption == 'r':
             st = 0
             for _ in range(0, g_random_moves + 1):
-                moves_dict = myboard.possibleMoves()
-                pos_moves_listed = list(moves_dict)
-                option = random.choice(pos_moves_listed)
-                print(option)
-                directions = moves_dict[option]
-                direction = random.choice(directions)
+                # every move of the board is equally likely.
+                option, direction = random.choice(myboard.cachedPlayableMoves())
                 myboard.move(option, direction)
-                myboard.printState()
-                print("Board shuffled", st, "times.")
+                if g_verbose and st % 11 == 0:
+                    myboard.printState()
+                    print("Board shuffled", st, "times.")
                 st += 1
+            myboard.printState()
+            print("Board shuffled", st, "times.")
 
         # Brute force
         if inputOption == 'b':
             st = 0
-            while myboard.defective != 0:
-                moves_dict = myboard.possibleMoves()
-                pos_moves_listed = list(moves_dict)
-                option = random.choice(pos_moves_listed)
-                directions = moves_dict[option]
-                direction = random.choice(directions)
+            # defective can stay above 0 once b is in place,
+            # the walk stops when the board is done.
+            while not myboard.done:
+                option, direction = random.choice(myboard.cachedPlayableMoves())
                 myboard.move(option, direction)
-                if st % 11 == 0:
+                if g_verbose and st % 11 == 0:
                     myboard.printState()
                     print("Board shuffled", st, "times.")
                 st += 1
             myboard.printState()
             print("Board shuffled", st, "times.")
 
-        # educated guess solution
-        if inputOption == 'a':
-            queue = [Node(moveNode(myboard))]
-            while queue:
-                queuedNode = queue.pop(0)
-                nextMoves = queuedNode.node.nodeMoves()
-                if nextMoves is None:
-                    print('\n\n')
-                    queuedNode.node.board.printState()
-                    print("Seen size " + str(len(moveNode.seen)))
-                    return
-
-                for ns in nextMoves:
-                    bisect.insort_left(queue, Node(ns))
-
-            print("No solution found")
+        # educated guess solution, or the shortest one
+        search = {'a': solve, 'd': dijkstra}.get(inputOption)
+        if search:
+            solved = search(myboard)
+            if solved is None:
+                print("No solution found")
+                return
+
+            # a bit of a celebration here!.
+            print('\n\n-----------*****************************-----------')
+            print('-----------* This solves the problem! **-----------')
+            print('-----------*****************************-----------\n\n')
+            for step, m in enumerate(solved.solution):
+                name = moveNode.names[m[1][0]]
+                print (f"Step {(step + 1)}, piece:, {m[0]}, moves {name}, {m[1][1]} steps")
+
+            print('\n\n')
+            solved.board.printState()
+            print("Seen size " + str(len(solved.seen)))
             return
 
         if inputOption == 's':
             myboard.printState()
 
-playBoard()
+if __name__ == '__main__':
+    playBoard()